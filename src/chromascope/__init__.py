@@ -1,10 +1,14 @@
 """Audio analysis engine for reactive generative art."""
 
-from chromascope.core.decomposer import AudioDecomposer
-from chromascope.core.analyzer import FeatureAnalyzer
-from chromascope.core.polisher import SignalPolisher
-from chromascope.io.exporter import ManifestExporter
-from chromascope.pipeline import AudioPipeline
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chromascope.core.analyzer import FeatureAnalyzer
+    from chromascope.core.decomposer import AudioDecomposer
+    from chromascope.core.polisher import SignalPolisher
+    from chromascope.io.exporter import ManifestExporter
+    from chromascope.pipeline import AudioPipeline
 
 __version__ = "0.1.0"
 __all__ = [
@@ -14,3 +18,24 @@ __all__ = [
     "ManifestExporter",
     "AudioPipeline",
 ]
+
+# Public classes are imported on first access so that lightweight entry
+# points (``chromascope --help``) don't pay for importing librosa.
+_EXPORTS = {
+    "AudioDecomposer": "chromascope.core.decomposer",
+    "FeatureAnalyzer": "chromascope.core.analyzer",
+    "SignalPolisher": "chromascope.core.polisher",
+    "ManifestExporter": "chromascope.io.exporter",
+    "AudioPipeline": "chromascope.pipeline",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(__all__ + list(globals()))
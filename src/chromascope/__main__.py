@@ -0,0 +1,8 @@
+"""Allow running the analysis CLI with ``python -m chromascope``."""
+
+import sys
+
+from chromascope.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
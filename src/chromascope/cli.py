@@ -4,14 +4,15 @@ Command-line interface for audio analysis.
 
 import argparse
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from chromascope.pipeline import AudioPipeline
 
-
-def main():
-    """Main CLI entry point."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         prog="audio-analyze",
         description="Extract visual driver features from audio files",
@@ -77,7 +78,51 @@ def main():
         help="Print manifest summary to stdout",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help=(
+            "Limit BLAS/OpenMP/Numba worker threads; only takes effect in a "
+            "fresh process (default: 0 = library default)"
+        ),
+    )
+
+    return parser
+
+
+def _limit_threads(n_threads: int):
+    """
+    Cap the native thread pools used by numpy, scipy and librosa.
+
+    Must run before numpy/numba are first imported, since the pools read
+    these variables once at load time.
+    """
+    if "numpy" in sys.modules:
+        print(
+            "Warning: --threads has no effect once numpy is already loaded",
+            file=sys.stderr,
+        )
+
+    value = str(n_threads)
+    for var in (
+        "OMP_NUM_THREADS",
+        "OPENBLAS_NUM_THREADS",
+        "MKL_NUM_THREADS",
+        "NUMBA_NUM_THREADS",
+    ):
+        os.environ[var] = value
+
+
+def main(argv: list[str] | None = None):
+    """Main CLI entry point."""
+    args = _build_parser().parse_args(argv)
+
+    if args.threads < 0:
+        print("Error: --threads must be >= 0", file=sys.stderr)
+        sys.exit(1)
+    if args.threads:
+        _limit_threads(args.threads)
 
     # Validate input
     if not args.input.exists():
@@ -90,8 +135,10 @@ def main():
         suffix = ".npz" if args.format == "numpy" else ".json"
         output_path = args.input.with_name(f"{args.input.stem}_manifest{suffix}")
 
-    # Create pipeline
+    # Create pipeline. Imported here so that --help and argument errors
+    # don't pay for loading librosa.
     from chromascope.core.polisher import EnvelopeParams
+    from chromascope.pipeline import AudioPipeline
 
     pipeline = AudioPipeline(
         target_fps=args.fps,
@@ -86,8 +86,9 @@ class AudioPipeline:
         """Calculate SHA256 hash of the file."""
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
+            # Read in 1 MiB chunks to handle large files without
+            # paying per-call overhead on every 4 KiB block
+            for byte_block in iter(lambda: f.read(1 << 20), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
@@ -206,6 +207,7 @@ class AudioPipeline:
         audio_path = Path(audio_path)
 
         # Caching logic
+        cache_path = None
         if use_cache:
             try:
                 cache_path = self._get_cache_path(audio_path)
@@ -255,7 +257,8 @@ class AudioPipeline:
         # Save to cache if enabled
         if use_cache:
             try:
-                cache_path = self._get_cache_path(audio_path)
+                if cache_path is None:
+                    cache_path = self._get_cache_path(audio_path)
                 with open(cache_path, "w", encoding="utf-8") as f:
                     json.dump(manifest, f, indent=2)
             except Exception as e:
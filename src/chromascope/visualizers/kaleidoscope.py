@@ -12,7 +12,8 @@ Maps audio features to geometric transformations:
 
 import colorsys
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,20 @@ import pygame
 from chromascope.visualizers.styles import get_kaleidoscope_style
 
 
+# pygame.image.tobytes was added in pygame 2.1.3; older releases only
+# provide the (now deprecated) tostring with the same signature.
+_surface_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+@lru_cache(maxsize=None)
+def _unit_polygon(num_sides: int) -> tuple[tuple[float, float], ...]:
+    """Unit-circle (cos, sin) vertex table for a regular polygon."""
+    return tuple(
+        (math.cos(2 * math.pi * i / num_sides), math.sin(2 * math.pi * i / num_sides))
+        for i in range(num_sides)
+    )
+
+
 @dataclass
 class KaleidoscopeConfig:
     """Configuration for the kaleidoscope renderer."""
@@ -46,6 +61,37 @@ class KaleidoscopeConfig:
     bg_particles: bool = True  # Enable particle effects
     bg_pulse: bool = True  # Enable beat pulse rings
     style: str = "geometric"  # Visualization style (geometric, glass, flower, spiral, circuit, fibonacci, fractal, dmt, sacred, mycelial, fluid, orrery, quark)
+    seed: int | None = None  # Random seed for particles and jitter (None = nondeterministic)
+
+
+@dataclass(eq=False)
+class ParticleField:
+    """
+    Background particle state, one array entry per particle.
+
+    Headings are fixed at construction: ``dir_x``/``dir_y`` are derived
+    from ``angle`` once, so reassigning ``angle`` later has no effect.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    size: np.ndarray
+    speed: np.ndarray
+    angle: np.ndarray
+    brightness: np.ndarray
+    pulse: np.ndarray
+    jitter: np.ndarray
+    dir_x: np.ndarray = field(init=False, repr=False)
+    dir_y: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Headings never change, so the unit direction is computed once
+        # instead of taking cos/sin of every angle on every frame.
+        self.dir_x = np.cos(self.angle)
+        self.dir_y = np.sin(self.angle)
+
+    def __len__(self) -> int:
+        return len(self.x)
 
 
 class KaleidoscopeRenderer:
@@ -75,6 +121,11 @@ class KaleidoscopeRenderer:
 
     NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
+    # Note name → hue, precomputed so per-frame lookups skip NOTE_NAMES.index
+    NOTE_TO_HUE = dict(
+        zip(NOTE_NAMES, map(CHROMA_TO_HUE.get, range(len(NOTE_NAMES))))
+    )
+
     def __init__(self, config: KaleidoscopeConfig | None = None):
         """
         Initialize the renderer.
@@ -95,9 +146,17 @@ class KaleidoscopeRenderer:
         self.accumulated_rotation = 0.0
         self.surface: pygame.Surface | None = None
 
+        # Trail fade overlay, reused across frames until its inputs change
+        self._fade_surface: pygame.Surface | None = None
+        self._fade_key: tuple | None = None
+
+        # Pre-rendered particle dots keyed by (gray value, radius)
+        self._dot_sprites: dict[tuple[int, int], pygame.Surface] = {}
+
         # Dynamic background state
         self.gradient_angle = 0.0
         self.pulse_intensity = 0.0
+        self._rng = np.random.default_rng(self.config.seed)
         self.particles = self._init_particles()
 
         # Smoothed values for fluid animation
@@ -110,30 +169,23 @@ class KaleidoscopeRenderer:
         self.smoothed_sub_bass = 0.0
         self.smoothed_brilliance = 0.0
 
-    def _init_particles(self) -> list[dict]:
+    def _init_particles(self, count: int = 80) -> ParticleField:
         """Initialize background particles."""
-        import random
-        particles = []
-        for _ in range(80):
-            particles.append({
-                'x': random.random() * self.config.width,
-                'y': random.random() * self.config.height,
-                'size': random.random() * 2 + 0.5,
-                'speed': random.random() * 0.5 + 0.1,
-                'angle': random.random() * math.pi * 2,
-                'brightness': random.random() * 0.5 + 0.3,
-                'pulse': random.random() * math.pi * 2,
-                'jitter': 0.0
-            })
-        return particles
+        rng = self._rng
+        return ParticleField(
+            x=rng.random(count) * self.config.width,
+            y=rng.random(count) * self.config.height,
+            size=rng.random(count) * 2 + 0.5,
+            speed=rng.random(count) * 0.5 + 0.1,
+            angle=rng.random(count) * math.pi * 2,
+            brightness=rng.random(count) * 0.5 + 0.3,
+            pulse=rng.random(count) * math.pi * 2,
+            jitter=np.zeros(count),
+        )
 
     def _note_to_hue(self, note: str) -> float:
         """Convert note name to hue value."""
-        try:
-            idx = self.NOTE_NAMES.index(note)
-            return self.CHROMA_TO_HUE[idx]
-        except ValueError:
-            return 0.5  # Default cyan
+        return self.NOTE_TO_HUE.get(note, 0.5)  # Default cyan
 
     def _hue_to_rgb(self, hue: float, saturation: float = 0.8, value: float = 0.9) -> tuple[int, int, int]:
         """Convert HSV to RGB color tuple."""
@@ -148,13 +200,15 @@ class KaleidoscopeRenderer:
         rotation: float,
     ) -> list[tuple[float, float]]:
         """Compute vertices of a regular polygon."""
-        points = []
-        for i in range(num_sides):
-            angle = rotation + (2 * math.pi * i / num_sides)
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-        return points
+        # Rotate the cached unit vertices instead of evaluating cos/sin
+        # for every vertex of every polygon on every frame.
+        cx, cy = center
+        c = radius * math.cos(rotation)
+        s = radius * math.sin(rotation)
+        return [
+            (cx + c * ux - s * uy, cy + s * ux + c * uy)
+            for ux, uy in _unit_polygon(num_sides)
+        ]
 
     def _draw_polygon(
         self,
@@ -171,6 +225,33 @@ class KaleidoscopeRenderer:
         if len(points) >= 3:
             pygame.draw.polygon(surface, color, points, thickness)
 
+    def _get_fade_surface(self) -> pygame.Surface:
+        """Return the trail fade overlay, rebuilding it only when config changes."""
+        cfg = self.config
+        fade_alpha = int((100 - cfg.trail_alpha) / 100 * 80) + 5
+        key = (cfg.width, cfg.height, tuple(cfg.background_color), fade_alpha)
+        if self._fade_surface is None or self._fade_key != key:
+            fade = pygame.Surface((cfg.width, cfg.height))
+            fade.fill(cfg.background_color)
+            fade.set_alpha(fade_alpha)
+            self._fade_surface = fade
+            self._fade_key = key
+        return self._fade_surface
+
+    def _get_dot_sprite(self, value: int, radius: int) -> pygame.Surface:
+        """Return a cached gray dot sprite matching pygame.draw.circle output."""
+        key = (value, radius)
+        sprite = self._dot_sprites.get(key)
+        if sprite is None:
+            size = radius * 2 + 1
+            sprite = pygame.Surface((size, size))
+            # Magenta is never a gray level, so it is safe as the colorkey
+            sprite.fill((255, 0, 255))
+            sprite.set_colorkey((255, 0, 255))
+            pygame.draw.circle(sprite, (value, value, value), (radius, radius), radius)
+            self._dot_sprites[key] = sprite
+        return sprite
+
     def _lerp(self, current: float, target: float, factor: float) -> float:
         """Linear interpolation helper."""
         return current + (target - current) * factor
@@ -222,25 +303,40 @@ class KaleidoscopeRenderer:
         # Create gradient effect using concentric circles
         # Jitter the center based on zero crossing rate
         zcr_jitter = self.smoothed_flatness * 50 * reactivity
-        import random
-        center_x = width // 2 + int(math.sin(self.gradient_angle * 3) * width * 0.1 * reactivity) + int((random.random() - 0.5) * zcr_jitter)
-        center_y = height // 2 + int(math.cos(self.gradient_angle * 2) * height * 0.1 * reactivity) + int((random.random() - 0.5) * zcr_jitter)
+        jitter_x, jitter_y = (self._rng.random(2) - 0.5) * zcr_jitter
+        center_x = width // 2 + int(math.sin(self.gradient_angle * 3) * width * 0.1 * reactivity) + int(jitter_x)
+        center_y = height // 2 + int(math.cos(self.gradient_angle * 2) * height * 0.1 * reactivity) + int(jitter_y)
 
         # Draw radial gradient approximation
         # Sub-bass expands the background radius
         max_radius = int(max(width, height) * (0.9 + self.smoothed_sub_bass * 0.2) + self.pulse_intensity * 200 * reactivity)
         steps = 20
 
+        # Outer circles that cover the whole surface are painted over by the
+        # next one in, so skip them and fill once with the innermost
+        # covering step. The +2 keeps the coverage test conservative.
+        reach_x = max(center_x, width - 1 - center_x)
+        reach_y = max(center_y, height - 1 - center_y)
+        cover_radius = math.hypot(reach_x, reach_y) + 2
+
+        # Shared by the coverage test and the draw so both see the same ints
+        step_radii = [int(max_radius * i / steps) for i in range(steps + 1)]
+
         for i in range(steps, 0, -1):
+            if i > 1 and step_radii[i - 1] >= cover_radius:
+                continue
             ratio = i / steps
-            radius = int(max_radius * ratio)
+            radius = step_radii[i]
             # Interpolate from boosted center to dark edge
             step_color = (
                 int(boosted_color[0] * ratio + c1[0] * (1 - ratio)),
                 int(boosted_color[1] * ratio + c1[1] * (1 - ratio)),
                 int(boosted_color[2] * ratio + c1[2] * (1 - ratio)),
             )
-            pygame.draw.circle(surface, step_color, (center_x, center_y), radius)
+            if radius >= cover_radius:
+                surface.fill(step_color)
+            else:
+                pygame.draw.circle(surface, step_color, (center_x, center_y), radius)
 
         # Render particles
         if cfg.bg_particles:
@@ -255,57 +351,65 @@ class KaleidoscopeRenderer:
         cfg = self.config
         reactivity = cfg.bg_reactivity
         energy_boost = 1 + self.smoothed_harmonic * 2 * reactivity
-        
+        p = self.particles
+
         # Spectral flatness adds jitter to particle movement
         jitter_amt = self.smoothed_flatness * 5 * reactivity
-        import random
-
-        for particle in self.particles:
-            # Update position
-            particle['jitter'] = self._lerp(particle['jitter'], (random.random() - 0.5) * jitter_amt, 0.2)
-            particle['x'] += math.cos(particle['angle']) * particle['speed'] * energy_boost + particle['jitter']
-            particle['y'] += math.sin(particle['angle']) * particle['speed'] * energy_boost + particle['jitter']
-
-            # Wrap around edges
-            if particle['x'] < 0:
-                particle['x'] = cfg.width
-            if particle['x'] > cfg.width:
-                particle['x'] = 0
-            if particle['y'] < 0:
-                particle['y'] = cfg.height
-            if particle['y'] > cfg.height:
-                particle['y'] = 0
-
-            # Pulse brightness
-            particle['pulse'] += 0.05
-            pulse_brightness = math.sin(particle['pulse']) * 0.3 + 0.7
-            beat_brightness = 1 + self.pulse_intensity * 0.5
-
-            # Calculate alpha and size
-            # Sharpness increases particle alpha
-            alpha = particle['brightness'] * pulse_brightness * beat_brightness * reactivity * (1 + self.smoothed_sharpness * 0.5)
-            size = particle['size'] * (1 + self.smoothed_percussive * 0.5)
-
-            # Draw particle
-            color_val = int(255 * min(1, alpha))
-            pygame.draw.circle(
-                surface,
-                (color_val, color_val, color_val),
-                (int(particle['x']), int(particle['y'])),
-                max(1, int(size))
-            )
-
-            # Add glow on high energy
-            if self.smoothed_percussive > 0.5:
-                glow_alpha = (self.smoothed_percussive - 0.5) * alpha * 0.3
-                glow_val = int(255 * min(1, glow_alpha))
-                if glow_val > 10:
-                    pygame.draw.circle(
-                        surface,
-                        (glow_val, glow_val, glow_val),
-                        (int(particle['x']), int(particle['y'])),
-                        max(1, int(size * 3))
-                    )
+        jitter_target = (self._rng.random(len(p)) - 0.5) * jitter_amt
+        p.jitter += (jitter_target - p.jitter) * 0.2
+
+        # Update positions
+        step = p.speed * energy_boost
+        p.x += p.dir_x * step + p.jitter
+        p.y += p.dir_y * step + p.jitter
+
+        # Wrap around edges
+        x_low, x_high = p.x < 0, p.x > cfg.width
+        p.x[x_low] = cfg.width
+        p.x[x_high] = 0
+        y_low, y_high = p.y < 0, p.y > cfg.height
+        p.y[y_low] = cfg.height
+        p.y[y_high] = 0
+
+        # Pulse brightness
+        p.pulse += 0.05
+        pulse_brightness = np.sin(p.pulse) * 0.3 + 0.7
+        beat_brightness = 1 + self.pulse_intensity * 0.5
+
+        # Calculate alpha and size
+        # Sharpness increases particle alpha
+        alpha = p.brightness * pulse_brightness * beat_brightness * reactivity * (1 + self.smoothed_sharpness * 0.5)
+        size = p.size * (1 + self.smoothed_percussive * 0.5)
+
+        color_vals = (255 * np.minimum(1, alpha)).astype(int)
+        radii = np.maximum(1, size.astype(int))
+
+        # Add glow on high energy
+        glow_vals = None
+        if self.smoothed_percussive > 0.5:
+            glow_alpha = (self.smoothed_percussive - 0.5) * alpha * 0.3
+            glow_vals = (255 * np.minimum(1, glow_alpha)).astype(int).tolist()
+            glow_radii = np.maximum(1, (size * 3).astype(int)).tolist()
+
+        # Draw every dot (and its glow) with a single batched blit.
+        # Order matters: each glow is drawn right after its particle.
+        xs = p.x.astype(int).tolist()
+        ys = p.y.astype(int).tolist()
+        get_sprite = self._get_dot_sprite
+        blits = []
+        for i, (px, py, color_val, radius) in enumerate(
+            zip(xs, ys, color_vals.tolist(), radii.tolist())
+        ):
+            blits.append((get_sprite(color_val, radius), (px - radius, py - radius)))
+
+            if glow_vals is not None and glow_vals[i] > 10:
+                glow_radius = glow_radii[i]
+                blits.append((
+                    get_sprite(glow_vals[i], glow_radius),
+                    (px - glow_radius, py - glow_radius),
+                ))
+
+        surface.blits(blits, doreturn=False)
 
     def _render_pulse_rings(self, surface: pygame.Surface):
         """Render expanding pulse rings on beats."""
@@ -492,13 +596,11 @@ class KaleidoscopeRenderer:
 
         # Trail effect: blend with previous frame
         if previous_surface is not None and cfg.trail_alpha > 0:
-            # Darken previous frame
-            fade = pygame.Surface((cfg.width, cfg.height))
-            fade.fill(cfg.background_color)
-            fade_alpha = int((100 - cfg.trail_alpha) / 100 * 80) + 5
-            fade.set_alpha(fade_alpha)
-            previous_surface.blit(fade, (0, 0))
+            # Carry over the previous frame, then darken it. Fading the new
+            # surface (not previous_surface) leaves the caller's frame intact,
+            # so render_manifest can keep it without a defensive copy.
             surface.blit(previous_surface, (0, 0))
+            surface.blit(self._get_fade_surface(), (0, 0))
         else:
             surface.fill(cfg.background_color)
 
@@ -535,7 +637,7 @@ class KaleidoscopeRenderer:
 
         for i, frame_data in enumerate(frames):
             surface = self.render_frame(frame_data, previous)
-            surfaces.append(surface.copy())
+            surfaces.append(surface)
             previous = surface
 
             if progress_callback:
@@ -545,8 +647,10 @@ class KaleidoscopeRenderer:
 
     def surface_to_array(self, surface: pygame.Surface) -> np.ndarray:
         """Convert pygame surface to numpy array for video encoding."""
-        # pygame uses (width, height) but numpy expects (height, width)
-        arr = pygame.surfarray.array3d(surface)
-        # Transpose from (width, height, 3) to (height, width, 3)
-        arr = np.transpose(arr, (1, 0, 2))
-        return arr
+        # Read pixels row-major as (height, width, 3). This costs two flat
+        # memcpys (tobytes, then bytearray for a writable result), which is
+        # still much cheaper than array3d's (width, height, 3) copy plus the
+        # strided transpose copy an encoder needs for contiguous memory.
+        width, height = surface.get_size()
+        pixels = bytearray(_surface_tobytes(surface, "RGB"))
+        return np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 3)
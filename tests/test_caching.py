@@ -118,3 +118,19 @@ def test_cache_invalidation_on_version_change(temp_audio_file, tmp_path, monkeyp
     files_final = list(tmp_path.glob("*.json"))
     assert len(files_final) == 2
     assert initial_cache_file in files_final
+
+
+def test_file_hash_computed_once_on_cache_miss(temp_audio_file, tmp_path, monkeypatch):
+    """Test that a cache-miss process() hashes the audio file only once."""
+    import chromascope.pipeline as pipeline_module
+
+    monkeypatch.setattr(AudioPipeline, "_get_cache_dir", lambda self: tmp_path)
+
+    pipeline = AudioPipeline(target_fps=60)
+    with patch.object(
+        pipeline_module.hashlib, "sha256", wraps=pipeline_module.hashlib.sha256
+    ) as mock_sha256:
+        pipeline.process(temp_audio_file)  # miss: lookup + save
+        assert mock_sha256.call_count == 1
+
+    assert len(list(tmp_path.glob("manifest_*.json"))) == 1
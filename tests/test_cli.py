@@ -0,0 +1,38 @@
+"""Tests for the command-line interface."""
+
+import os
+
+import pytest
+
+from chromascope.cli import main
+
+THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+
+def test_threads_sets_env_vars(tmp_path, monkeypatch):
+    """--threads should export the limit to every native thread pool."""
+    # setenv first so teardown restores (or removes) every variable
+    for var in THREAD_VARS:
+        monkeypatch.setenv(var, "")
+        monkeypatch.delenv(var)
+
+    # Missing input exits after the thread limits are applied
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "missing.wav"), "--threads", "2"])
+
+    for var in THREAD_VARS:
+        assert os.environ[var] == "2"
+
+
+def test_threads_negative_exits(tmp_path, capsys):
+    """A negative --threads value should be rejected with status 1."""
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(tmp_path / "missing.wav"), "--threads", "-1"])
+
+    assert exc_info.value.code == 1
+    assert "--threads must be >= 0" in capsys.readouterr().err
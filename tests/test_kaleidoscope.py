@@ -48,12 +48,21 @@ class TestKaleidoscopeRenderer:
 
     def test_particle_initialization(self, renderer):
         """Particles should be initialized."""
-        assert len(renderer.particles) == 80
-        for particle in renderer.particles:
-            assert 'x' in particle
-            assert 'y' in particle
-            assert 'size' in particle
-            assert 'brightness' in particle
+        particles = renderer.particles
+        assert len(particles) == 80
+        for field in ("x", "y", "size", "brightness"):
+            assert getattr(particles, field).shape == (80,)
+        assert np.all((particles.x >= 0) & (particles.x <= 640))
+        assert np.all((particles.y >= 0) & (particles.y <= 480))
+
+    def test_particles_stay_on_screen(self, renderer, sample_frame):
+        """Particles should wrap around the edges as they move."""
+        frame = dict(sample_frame, spectral_flatness=1.0)
+        for _ in range(50):
+            renderer.render_frame(frame)
+        particles = renderer.particles
+        assert np.all((particles.x >= 0) & (particles.x <= 640))
+        assert np.all((particles.y >= 0) & (particles.y <= 480))
 
     def test_render_frame_returns_surface(self, renderer, sample_frame):
         """render_frame should return a pygame Surface."""
@@ -68,6 +77,14 @@ class TestKaleidoscopeRenderer:
         second_surface = renderer.render_frame(sample_frame, first_surface)
         assert isinstance(second_surface, pygame.Surface)
 
+    def test_render_frame_leaves_previous_surface_intact(self, renderer, sample_frame):
+        """The trail fade should not modify the caller's previous frame."""
+        first_surface = renderer.render_frame(sample_frame)
+        before = renderer.surface_to_array(first_surface).copy()
+        second_surface = renderer.render_frame(sample_frame, first_surface)
+        assert second_surface is not first_surface
+        assert np.array_equal(renderer.surface_to_array(first_surface), before)
+
     def test_accumulated_rotation_increases(self, renderer, sample_frame):
         """Rotation should accumulate over frames."""
         initial_rotation = renderer.accumulated_rotation
@@ -206,3 +223,83 @@ class TestKaleidoscopeRenderer:
         assert renderer.config.num_mirrors == preset["num_mirrors"]
         assert renderer.config.base_radius == preset["base_radius"]
         assert renderer.config.trail_alpha == preset["trail_alpha"]
+
+    def test_fade_surface_reused_across_frames(self, renderer, sample_frame):
+        """The trail fade overlay should be built once and reused."""
+        first = renderer.render_frame(sample_frame)
+        second = renderer.render_frame(sample_frame, first)
+        fade = renderer._fade_surface
+        assert fade is not None
+
+        renderer.render_frame(sample_frame, second)
+        assert renderer._fade_surface is fade
+
+        # Changing the trail setting rebuilds it
+        renderer.config.trail_alpha = 10
+        renderer.render_frame(sample_frame, second)
+        assert renderer._fade_surface is not fade
+
+    def test_dot_sprites_match_draw_circle(self, renderer):
+        """Blitted particle sprites should match pygame.draw.circle pixel-for-pixel."""
+        drawn = pygame.Surface((64, 64))
+        blitted = pygame.Surface((64, 64))
+        drawn.fill((5, 5, 15))
+        blitted.fill((5, 5, 15))
+
+        for value, radius, center in [(0, 1, (10, 10)), (128, 3, (30, 20)),
+                                      (255, 7, (60, 60)), (200, 11, (0, 40))]:
+            pygame.draw.circle(drawn, (value, value, value), center, radius)
+            sprite = renderer._get_dot_sprite(value, radius)
+            blitted.blit(sprite, (center[0] - radius, center[1] - radius))
+
+        assert np.array_equal(
+            renderer.surface_to_array(drawn), renderer.surface_to_array(blitted)
+        )
+
+    def test_surface_to_array_matches_surfarray(self, renderer, sample_frame):
+        """surface_to_array should return contiguous, writable pixels in (H, W, 3) order."""
+        surface = renderer.render_frame(sample_frame)
+        arr = renderer.surface_to_array(surface)
+        expected = np.transpose(pygame.surfarray.array3d(surface), (1, 0, 2))
+        assert np.array_equal(arr, expected)
+        assert arr.flags["C_CONTIGUOUS"]
+        assert arr.flags["WRITEABLE"]
+
+    def test_polygon_points_match_direct_trig(self, renderer):
+        """Cached unit-polygon vertices should match direct cos/sin evaluation."""
+        import math
+
+        center, radius, rotation = (320.0, 240.0), 123.4, 1.7
+        for num_sides in (3, 7, 12, 17):
+            points = renderer._compute_polygon_points(center, radius, num_sides, rotation)
+            assert len(points) == num_sides
+            for i, (x, y) in enumerate(points):
+                angle = rotation + 2 * math.pi * i / num_sides
+                assert x == pytest.approx(center[0] + radius * math.cos(angle))
+                assert y == pytest.approx(center[1] + radius * math.sin(angle))
+
+    def test_seeded_renders_are_reproducible(self, sample_frame):
+        """Two renderers with the same seed should produce identical frames."""
+        from chromascope.visualizers.kaleidoscope import (
+            KaleidoscopeConfig,
+            KaleidoscopeRenderer,
+        )
+
+        frame = dict(sample_frame, spectral_flatness=0.8)
+        arrays = []
+        for _ in range(2):
+            renderer = KaleidoscopeRenderer(
+                KaleidoscopeConfig(width=320, height=240, seed=7)
+            )
+            surface = None
+            for _ in range(5):
+                surface = renderer.render_frame(frame, surface)
+            arrays.append(renderer.surface_to_array(surface))
+
+        assert np.array_equal(arrays[0], arrays[1])
+
+    def test_note_to_hue_lookup(self, renderer):
+        """Note names should map to the same hue as their chroma index."""
+        for idx, note in enumerate(renderer.NOTE_NAMES):
+            assert renderer._note_to_hue(note) == renderer.CHROMA_TO_HUE[idx]
+        assert renderer._note_to_hue("H") == 0.5  # Unknown note → default cyan